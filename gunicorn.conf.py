@@ -0,0 +1,13 @@
+"""
+Gunicorn configuration for the E-commerce app
+Usage: gunicorn app:app
+"""
+
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+
+# gevent workers keep many DB-bound requests in flight per process
+worker_class = 'gevent'
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+worker_connections = 1000